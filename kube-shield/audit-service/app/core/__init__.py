@@ -1,4 +1,6 @@
 """Core module initialization."""
+from .clock import utc_now_iso
 from .config import Settings, get_settings
+from .responses import MsgspecJSONResponse
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "utc_now_iso", "MsgspecJSONResponse"]
@@ -0,0 +1,24 @@
+"""
+Fast UTC timestamp formatting for hot paths.
+"""
+import time
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted
+_second_cache: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with a "Z" suffix.
+
+    Equivalent to ``datetime.utcnow().isoformat() + "Z"`` (always with
+    microseconds) but without building a datetime per call: the date and
+    time-of-day prefix is formatted once per wall-clock second.
+    """
+    global _second_cache
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _second_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _second_cache = (sec, prefix)
+    return f"{prefix}.{frac // 1000:06d}Z"
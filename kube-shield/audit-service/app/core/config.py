@@ -2,24 +2,42 @@
 Core configuration for the Audit Service.
 """
 import os
+from dataclasses import dataclass
 from functools import lru_cache
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables."""
     
-    def __init__(self):
-        self.app_name: str = os.getenv("APP_NAME", "Kube-Shield Audit Service")
-        self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
-        self.host: str = os.getenv("HOST", "0.0.0.0")
-        self.port: int = int(os.getenv("PORT", "8000"))
-        self.max_logs: int = int(os.getenv("MAX_LOGS", "100"))
-        self.simulation_enabled: bool = os.getenv("SIMULATION_ENABLED", "true").lower() == "true"
-        self.simulation_interval: int = int(os.getenv("SIMULATION_INTERVAL", "5"))
-        self.cors_origins: list[str] = os.getenv("CORS_ORIGINS", "*").split(",")
+    app_name: str = "Kube-Shield Audit Service"
+    debug: bool = False
+    host: str = "0.0.0.0"
+    port: int = 8000
+    max_logs: int = 100
+    simulation_enabled: bool = True
+    simulation_interval: float = 5.0
+    simulation_batch_size: int = 1
+    cors_origins: tuple[str, ...] = ("*",)
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read all settings from the environment in one pass."""
+        env = os.environ
+        return cls(
+            app_name=env.get("APP_NAME", "Kube-Shield Audit Service"),
+            debug=env.get("DEBUG", "false").lower() == "true",
+            host=env.get("HOST", "0.0.0.0"),
+            port=int(env.get("PORT", "8000")),
+            max_logs=int(env.get("MAX_LOGS", "100")),
+            simulation_enabled=env.get("SIMULATION_ENABLED", "true").lower() == "true",
+            simulation_interval=float(env.get("SIMULATION_INTERVAL", "5")),
+            simulation_batch_size=int(env.get("SIMULATION_BATCH_SIZE", "1")),
+            cors_origins=tuple(env.get("CORS_ORIGINS", "*").split(",")),
+        )
 
 
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return Settings.from_env()
@@ -0,0 +1,19 @@
+"""
+JSON response class backed by msgspec.
+"""
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response rendered with msgspec.
+
+    Stored events are msgspec Structs, which are encoded directly without
+    building an intermediate dict; plain dicts and lists are supported too.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
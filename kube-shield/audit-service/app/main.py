@@ -2,16 +2,18 @@
 Kube-Shield Audit Service
 Main FastAPI application entry point.
 """
+import asyncio
 import time
-from contextlib import asynccontextmanager
-from datetime import datetime
+from contextlib import asynccontextmanager, suppress
 
+import msgspec
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
-from .core import get_settings
-from .models import HealthResponse, StatusResponse, SecurityEvent
+from .core import MsgspecJSONResponse, get_settings
+from .middleware import HealthCheckInterceptor
+from .models import StatusResponse, SimulatedEvent
 from .routers import router, legacy_router
 from .services import get_log_storage, SimulationService
 
@@ -21,11 +23,21 @@ START_TIME = time.time()
 # Global simulation service reference
 simulation_service: SimulationService | None = None
 
+# Serialized /status body, recomputed at most once per STATUS_CACHE_TTL
+STATUS_CACHE_TTL = 1.0
+_status_cache: dict = {"ts": float("-inf"), "body": b""}
 
-def simulation_callback(event: SecurityEvent) -> None:
-    """Callback to store simulated events."""
+
+def simulation_active() -> bool:
+    """Report whether the simulation service is running."""
+    return simulation_service.is_running if simulation_service else False
+
+
+def simulation_callback(events: list[SimulatedEvent]) -> None:
+    """Callback to queue a batch of simulated events for storage."""
     storage = get_log_storage()
-    storage.add(event, source="simulation")
+    for event in events:
+        storage.enqueue(event, source="simulation")
 
 
 @asynccontextmanager
@@ -34,16 +46,18 @@ async def lifespan(app: FastAPI):
     global simulation_service
     
     settings = get_settings()
-    
-    # Initialize log storage
-    get_log_storage(settings.max_logs)
+    storage = get_log_storage()
+    drain_task: asyncio.Task | None = None
     
     # Start simulation if enabled
     if settings.simulation_enabled:
+        # Drain events queued by the simulation into log storage
+        drain_task = asyncio.create_task(storage.drain_loop())
         simulation_service = SimulationService(
             callback=simulation_callback,
             interval=settings.simulation_interval,
             enabled=True,
+            batch_size=settings.simulation_batch_size,
         )
         simulation_service.start()
         print(f"[INFO] Simulation started with {settings.simulation_interval}s interval")
@@ -53,37 +67,33 @@ async def lifespan(app: FastAPI):
     # Cleanup
     if simulation_service:
         simulation_service.stop()
+    if drain_task:
+        drain_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await drain_task
+        storage.drain()
 
 
 # Create FastAPI application
-app = FastAPI(
+fastapi_app = FastAPI(
     title="Kube-Shield Audit Service",
     description="Security event logging and monitoring service for Kube-Shield",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=MsgspecJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
 
-# Configure CORS
-settings = get_settings()
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # Include routers
-app.include_router(router)
-app.include_router(legacy_router)
+fastapi_app.include_router(router)
+fastapi_app.include_router(legacy_router)
 
 
-@app.get("/", include_in_schema=False)
+@fastapi_app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint redirect to docs."""
-    return JSONResponse(
+    return MsgspecJSONResponse(
         content={
             "service": "Kube-Shield Audit Service",
             "version": "1.0.0",
@@ -92,40 +102,38 @@ async def root():
     )
 
 
-@app.get("/health", response_model=HealthResponse, tags=["health"])
-async def health_check() -> HealthResponse:
-    """Health check endpoint for Kubernetes probes."""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        version="1.0.0",
-        simulation_active=simulation_service.is_running if simulation_service else False,
-    )
-
+@fastapi_app.get("/status", responses={200: {"model": StatusResponse}}, tags=["health"])
+async def get_status() -> Response:
+    """Get detailed service status."""
+    # Cache age is measured on the monotonic clock so wall clock steps
+    # cannot pin a stale body; uptime still comes from the wall clock
+    now = time.monotonic()
+    if now - _status_cache["ts"] > STATUS_CACHE_TTL:
+        storage = get_log_storage()
+        body = msgspec.json.encode({
+            "enforcement_status": "ENFORCING",
+            "uptime_seconds": round(time.time() - START_TIME, 2),
+            "total_logs": storage.count(),
+            "simulation_enabled": simulation_active(),
+        })
+        _status_cache.update(ts=now, body=body)
+    
+    return Response(_status_cache["body"], media_type="application/json")
 
-@app.get("/ready", response_model=HealthResponse, tags=["health"])
-async def readiness_check() -> HealthResponse:
-    """Readiness check endpoint for Kubernetes probes."""
-    return HealthResponse(
-        status="ready",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        version="1.0.0",
-        simulation_active=simulation_service.is_running if simulation_service else False,
-    )
 
+# Kubernetes probes (/health, /ready) are answered before the FastAPI stack
+app = HealthCheckInterceptor(fastapi_app, simulation_active=simulation_active)
 
-@app.get("/status", response_model=StatusResponse, tags=["health"])
-async def get_status() -> StatusResponse:
-    """Get detailed service status."""
-    storage = get_log_storage()
-    uptime = time.time() - START_TIME
-    
-    return StatusResponse(
-        enforcement_status="ENFORCING",
-        uptime_seconds=round(uptime, 2),
-        total_logs=storage.count(),
-        simulation_enabled=simulation_service.is_running if simulation_service else False,
-    )
+# Configure CORS outermost so the intercepted probes get the same headers as
+# every route; requests without an Origin header pass straight through
+settings = get_settings()
+app = CORSMiddleware(
+    app,
+    allow_origins=settings.cors_origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 
 if __name__ == "__main__":
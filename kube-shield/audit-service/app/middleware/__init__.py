@@ -0,0 +1,4 @@
+"""Middleware module initialization."""
+from .health import HealthCheckInterceptor
+
+__all__ = ["HealthCheckInterceptor"]
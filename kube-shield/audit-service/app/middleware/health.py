@@ -0,0 +1,73 @@
+"""
+Pure ASGI interceptor that answers Kubernetes health probes.
+"""
+import time
+from typing import Callable
+
+import msgspec
+
+from ..core import utc_now_iso
+
+
+class HealthCheckInterceptor:
+    """
+    Serve GET /health and GET /ready before the FastAPI application.
+
+    Kubelet probes hit these paths continuously, so they are answered here
+    without going through FastAPI's middleware stack, routing or Pydantic.
+    All other requests and the lifespan protocol are passed to the wrapped
+    app. CORS is applied outside this interceptor (see app.main).
+    Each probe's response is serialized at most once per CACHE_TTL seconds.
+    """
+    
+    PROBES = {"/health": "healthy", "/ready": "ready"}
+    CACHE_TTL = 1.0
+    
+    def __init__(
+        self,
+        app: Callable,
+        simulation_active: Callable[[], bool],
+        version: str = "1.0.0",
+    ):
+        self.app = app
+        self._simulation_active = simulation_active
+        self._version = version
+        # status -> (rendered at, body, response headers)
+        self._cache: dict[str, tuple[float, bytes, list[tuple[bytes, bytes]]]] = {}
+    
+    def _render(self, status: str) -> bytes:
+        """Serialize a HealthResponse-shaped payload."""
+        return msgspec.json.encode({
+            "status": status,
+            "timestamp": utc_now_iso(),
+            "version": self._version,
+            "simulation_active": self._simulation_active(),
+        })
+    
+    def _cached(self, status: str) -> tuple[bytes, list[tuple[bytes, bytes]]]:
+        """Get the body and headers for a probe, re-rendering when stale."""
+        now = time.monotonic()
+        cached = self._cache.get(status)
+        if cached is None or now - cached[0] > self.CACHE_TTL:
+            body = self._render(status)
+            headers = [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ]
+            cached = self._cache[status] = (now, body, headers)
+        return cached[1], cached[2]
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            status = self.PROBES.get(scope["path"])
+            if status is not None:
+                body, headers = self._cached(status)
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": headers,
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+        
+        await self.app(scope, receive, send)
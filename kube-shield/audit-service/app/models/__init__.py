@@ -1,7 +1,9 @@
 """Models module initialization."""
 from .events import (
     SecurityEvent,
+    SimulatedEvent,
     StoredEvent,
+    StoredEventRecord,
     MetricsResponse,
     AttackVolumeResponse,
     TimeSeriesPoint,
@@ -9,11 +11,14 @@ from .events import (
     StatusResponse,
     Severity,
     EventType,
+    INTERNED_VALUES,
 )
 
 __all__ = [
     "SecurityEvent",
+    "SimulatedEvent",
     "StoredEvent",
+    "StoredEventRecord",
     "MetricsResponse",
     "AttackVolumeResponse",
     "TimeSeriesPoint",
@@ -21,4 +26,5 @@ __all__ = [
     "StatusResponse",
     "Severity",
     "EventType",
+    "INTERNED_VALUES",
 ]
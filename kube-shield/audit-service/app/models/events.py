@@ -1,10 +1,12 @@
 """
 Pydantic models for security events and API responses.
 """
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+import msgspec
 from pydantic import BaseModel, Field
 
 
@@ -33,6 +35,16 @@ class EventType(str, Enum):
     DATA_EXFILTRATION = "DATA_EXFILTRATION"
 
 
+# Interned instances of the known severity and event type strings. Incoming
+# values are swapped for these so comparisons and Counter lookups on stored
+# events hit CPython's identity fast path; unknown values are left as-is
+# rather than interned, so request bodies cannot grow the intern table.
+INTERNED_VALUES: dict[str, str] = {
+    value: value
+    for value in (sys.intern(member.value) for member in (*Severity, *EventType))
+}
+
+
 class SecurityEvent(BaseModel):
     """Model representing a security event."""
     
@@ -53,6 +65,29 @@ class SecurityEvent(BaseModel):
         populate_by_name = True
 
 
+class SimulatedEvent(msgspec.Struct, gc=False):
+    """
+    Security event produced by the simulation service.
+
+    Carries the same attributes as SecurityEvent, so storage accepts either,
+    but as a slotted msgspec Struct: the simulator's values are trusted, so
+    generated events skip Pydantic validation and the per-instance __dict__.
+    """
+    
+    timestamp: str
+    event_type: str
+    severity: str
+    pod_name: str
+    namespace: str
+    container: Optional[str]
+    image: Optional[str]
+    reason: str
+    action: str
+    policy_name: str
+    node_name: Optional[str]
+    description: str
+
+
 class StoredEvent(BaseModel):
     """Model for stored events with additional metadata."""
     
@@ -73,6 +108,35 @@ class StoredEvent(BaseModel):
     source: str = Field(default="operator", description="Source of the event")
 
 
+class StoredEventRecord(msgspec.Struct, gc=False):
+    """
+    Internal representation of a stored event.
+
+    Built from an already validated SecurityEvent, so it skips Pydantic
+    entirely, and is encoded straight to JSON by msgspec. Mirrors the
+    fields of StoredEvent, which is kept for the OpenAPI schema.
+
+    Every field is a string or None, so records can never form reference
+    cycles and are kept out of the cyclic garbage collector (gc=False).
+    """
+    
+    id: str
+    timestamp: str
+    event_type: str
+    severity: str
+    pod_name: str
+    namespace: str
+    container: Optional[str]
+    image: Optional[str]
+    reason: str
+    action: str
+    policy_name: str
+    node_name: Optional[str]
+    description: str
+    received_at: str
+    source: str = "operator"
+
+
 class MetricsResponse(BaseModel):
     """Response model for metrics endpoint."""
     
@@ -4,22 +4,26 @@ API routes for security event logging and retrieval.
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
 
+from ..core import MsgspecJSONResponse
 from ..models import (
     SecurityEvent,
     StoredEvent,
     MetricsResponse,
     AttackVolumeResponse,
-    TimeSeriesPoint,
 )
 from ..services import get_log_storage
 
 router = APIRouter(prefix="/api/v1", tags=["logs"])
 
 
-@router.post("/log", response_model=StoredEvent, status_code=201)
-async def create_log(event: SecurityEvent) -> StoredEvent:
+# Handlers return MsgspecJSONResponse directly so FastAPI skips
+# jsonable_encoder and response_model revalidation; msgspec encodes the
+# stored records without an intermediate dict. Only the SecurityEvent
+# request body is validated. The response models are kept in `responses`
+# so the OpenAPI schema is unchanged.
+@router.post("/log", status_code=201, responses={201: {"model": StoredEvent}})
+async def create_log(event: SecurityEvent) -> MsgspecJSONResponse:
     """
     Create a new security event log.
     
@@ -28,25 +32,26 @@ async def create_log(event: SecurityEvent) -> StoredEvent:
     """
     storage = get_log_storage()
     stored_event = storage.add(event, source="operator")
-    return stored_event
+    return MsgspecJSONResponse(stored_event, status_code=201)
 
 
-@router.get("/logs", response_model=list[StoredEvent])
+@router.get("/logs", responses={200: {"model": list[StoredEvent]}})
 async def get_logs(
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of logs to return"),
     severity: Optional[str] = Query(None, description="Filter by severity level"),
-) -> list[StoredEvent]:
+) -> MsgspecJSONResponse:
     """
     Get all stored security event logs.
     
     Returns logs in reverse chronological order (newest first).
     """
     storage = get_log_storage()
-    return storage.get_all(limit=limit, severity=severity)
+    events = storage.get_all(limit=limit, severity=severity)
+    return MsgspecJSONResponse(events)
 
 
-@router.get("/logs/{event_id}", response_model=StoredEvent)
-async def get_log_by_id(event_id: str) -> StoredEvent:
+@router.get("/logs/{event_id}", responses={200: {"model": StoredEvent}})
+async def get_log_by_id(event_id: str) -> MsgspecJSONResponse:
     """
     Get a specific security event by ID.
     """
@@ -54,25 +59,24 @@ async def get_log_by_id(event_id: str) -> StoredEvent:
     event = storage.get_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return event
+    return MsgspecJSONResponse(event)
 
 
-@router.get("/metrics", response_model=MetricsResponse)
-async def get_metrics() -> MetricsResponse:
+@router.get("/metrics", responses={200: {"model": MetricsResponse}})
+async def get_metrics() -> MsgspecJSONResponse:
     """
     Get aggregated security metrics.
     
     Returns counts and statistics about security events.
     """
     storage = get_log_storage()
-    metrics = storage.get_metrics()
-    return MetricsResponse(**metrics)
+    return MsgspecJSONResponse(storage.get_metrics())
 
 
-@router.get("/attack-volume", response_model=AttackVolumeResponse)
+@router.get("/attack-volume", responses={200: {"model": AttackVolumeResponse}})
 async def get_attack_volume(
     minutes: int = Query(30, ge=5, le=120, description="Time range in minutes"),
-) -> AttackVolumeResponse:
+) -> MsgspecJSONResponse:
     """
     Get attack volume time series data.
     
@@ -81,9 +85,9 @@ async def get_attack_volume(
     storage = get_log_storage()
     data = storage.get_attack_volume(minutes=minutes)
     
-    points = [TimeSeriesPoint(timestamp=ts, value=count) for ts, count in data]
+    points = [{"timestamp": ts, "value": count} for ts, count in data]
     
-    return AttackVolumeResponse(data=points, interval="5s")
+    return MsgspecJSONResponse({"data": points, "interval": "5s"})
 
 
 @router.delete("/logs", status_code=204)
@@ -102,16 +106,17 @@ async def clear_logs():
 legacy_router = APIRouter(tags=["legacy"])
 
 
-@legacy_router.post("/log", response_model=StoredEvent, status_code=201)
-async def legacy_create_log(event: SecurityEvent) -> StoredEvent:
+@legacy_router.post("/log", status_code=201, responses={201: {"model": StoredEvent}})
+async def legacy_create_log(event: SecurityEvent) -> MsgspecJSONResponse:
     """Legacy endpoint: Create a new security event log."""
     storage = get_log_storage()
     stored_event = storage.add(event, source="operator")
-    return stored_event
+    return MsgspecJSONResponse(stored_event, status_code=201)
 
 
-@legacy_router.get("/logs")
-async def legacy_get_logs(limit: int = 50) -> list[StoredEvent]:
+@legacy_router.get("/logs", responses={200: {"model": list[StoredEvent]}})
+async def legacy_get_logs(limit: int = 50) -> MsgspecJSONResponse:
     """Legacy endpoint: Get stored logs."""
     storage = get_log_storage()
-    return storage.get_all(limit=limit)
+    events = storage.get_all(limit=limit)
+    return MsgspecJSONResponse(events)
@@ -1,31 +1,70 @@
 """
 Log storage service with in-memory storage and maximum capacity.
 """
+import asyncio
+import bisect
+import itertools
+import logging
+import operator
+import queue
+import secrets
 import threading
-import uuid
-from collections import deque
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Sequence, Union
 
-from ..models import SecurityEvent, StoredEvent
+from ..core import get_settings, utc_now_iso
+from ..models import INTERNED_VALUES, SecurityEvent, SimulatedEvent, StoredEventRecord
+
+# Event ids are a random per-process prefix plus a monotonic counter, which
+# is unique within the process and far cheaper than uuid4() per event. Ids
+# are assigned eagerly: _by_id indexes every record on insert and every
+# /logs payload includes the id, so deferring generation would save nothing.
+_ID_PREFIX = secrets.token_hex(8)
+_ID_COUNTER = itertools.count()
+
+_log = logging.getLogger(__name__)
+
+_severity = operator.attrgetter("severity")
+_event_type = operator.attrgetter("event_type")
+_policy_name = operator.attrgetter("policy_name")
+_action = operator.attrgetter("action")
 
 
 class LogStorage:
     """Thread-safe in-memory log storage with maximum capacity."""
     
     def __init__(self, max_logs: int = 100):
-        self._logs: deque[StoredEvent] = deque(maxlen=max_logs)
+        # Unbounded; _append evicts explicitly so the indexes stay in step
+        self._logs: deque[StoredEventRecord] = deque()
         self._lock = threading.Lock()
         self._max_logs = max_logs
-        self._time_series: deque[tuple[datetime, int]] = deque(maxlen=720)  # 1 hour at 5s intervals
+        # Immutable newest-first copy of _logs for lock-free reads; None
+        # after a write until the next get_all rebuilds it
+        self._snapshot: Optional[tuple[StoredEventRecord, ...]] = None
+        # Attack volume buckets as parallel, time-ordered lists so the cutoff
+        # can be found with bisect; trimmed to 720 points (1 hour at 5s intervals).
+        # _ts_times must stay sorted, see _update_time_series
+        self._ts_times: list[datetime] = []
+        self._ts_counts: list[int] = []
+        self._ts_max_points = 720
+        # Indexes and running aggregates for get_metrics, kept in step with _logs
+        self._by_id: dict[str, StoredEventRecord] = {}
+        self._logs_by_severity: defaultdict[str, deque[StoredEventRecord]] = defaultdict(deque)
+        self._by_severity: Counter[str] = Counter()
+        self._by_type: Counter[str] = Counter()
+        self._policies: Counter[str] = Counter()
+        self._terminated = 0
+        # Events queued by enqueue() from background threads, see drain()
+        self._ingress: queue.SimpleQueue[StoredEventRecord] = queue.SimpleQueue()
         
-    def add(self, event: SecurityEvent, source: str = "operator") -> StoredEvent:
-        """Add a new event to storage."""
-        stored_event = StoredEvent(
-            id=str(uuid.uuid4()),
+    def _build(self, event: Union[SecurityEvent, SimulatedEvent], source: str) -> StoredEventRecord:
+        """Create the stored record for an incoming event."""
+        return StoredEventRecord(
+            id=f"{_ID_PREFIX}-{next(_ID_COUNTER):012x}",
             timestamp=event.timestamp,
-            event_type=event.event_type,
-            severity=event.severity,
+            event_type=INTERNED_VALUES.get(event.event_type, event.event_type),
+            severity=INTERNED_VALUES.get(event.severity, event.severity),
             pod_name=event.pod_name,
             namespace=event.namespace,
             container=event.container,
@@ -35,51 +74,141 @@ class LogStorage:
             policy_name=event.policy_name,
             node_name=event.node_name,
             description=event.description,
-            received_at=datetime.utcnow().isoformat() + "Z",
+            received_at=utc_now_iso(),
             source=source,
         )
+    
+    def add(self, event: SecurityEvent, source: str = "operator") -> StoredEventRecord:
+        """Add a new event to storage."""
+        stored_event = self._build(event, source)
         
         with self._lock:
-            self._logs.append(stored_event)
-            self._update_time_series()
+            self._count((stored_event,))
+            self._append(stored_event)
             
         return stored_event
     
+    def enqueue(self, event: Union[SecurityEvent, SimulatedEvent], source: str = "simulation") -> None:
+        """
+        Queue an event for storage without taking the lock.
+        
+        Meant for producer threads such as the simulation; queued events
+        become visible once drain() moves them into storage.
+        """
+        self._ingress.put(self._build(event, source))
+    
+    def drain(self) -> int:
+        """Move all queued events into storage under one lock acquisition."""
+        batch = []
+        try:
+            while True:
+                batch.append(self._ingress.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            with self._lock:
+                self._count(batch)
+                for stored_event in batch:
+                    self._append(stored_event)
+        return len(batch)
+    
+    async def drain_loop(self, interval: float = 0.05) -> None:
+        """Drain queued events every `interval` seconds until cancelled."""
+        while True:
+            try:
+                self.drain()
+            except Exception:
+                # Keep draining; a dead loop would let the unbounded ingress
+                # queue grow for the rest of the process lifetime
+                _log.exception("Failed to drain queued events")
+            await asyncio.sleep(interval)
+    
+    def _append(self, stored_event: StoredEventRecord) -> None:
+        """Append a record, evicting the oldest one over capacity. Caller holds the lock."""
+        self._logs.append(stored_event)
+        self._snapshot = None
+        self._by_id[stored_event.id] = stored_event
+        self._logs_by_severity[stored_event.severity].append(stored_event)
+        # Evicting after the append also covers max_logs == 0, where the new
+        # record itself is dropped again
+        if len(self._logs) > self._max_logs:
+            self._forget(self._logs.popleft())
+        self._update_time_series()
+    
+    def _count(self, events: Sequence[StoredEventRecord]) -> None:
+        """
+        Add events to the running metrics aggregates. Caller holds the lock.
+        
+        Must run before the events are appended, so that evicting one of
+        them within the same batch never drives a counter below zero.
+        Counter.update and countOf consume the attrgetter maps in C.
+        """
+        self._by_severity.update(map(_severity, events))
+        self._by_type.update(map(_event_type, events))
+        self._policies.update(map(_policy_name, events))
+        self._terminated += operator.countOf(map(_action, events), "TERMINATED")
+    
+    def _forget(self, event: StoredEventRecord) -> None:
+        """Remove an evicted event from the indexes and metrics aggregates."""
+        self._by_id.pop(event.id, None)
+        # The evicted event is the oldest overall, so also the oldest of its severity
+        same_severity = self._logs_by_severity[event.severity]
+        same_severity.popleft()
+        if not same_severity:
+            del self._logs_by_severity[event.severity]
+        for counter, key in (
+            (self._by_severity, event.severity),
+            (self._by_type, event.event_type),
+            (self._policies, event.policy_name),
+        ):
+            counter[key] -= 1
+            if not counter[key]:
+                del counter[key]
+        if event.action == "TERMINATED":
+            self._terminated -= 1
+    
     def _update_time_series(self) -> None:
         """Update time series data for attack volume tracking."""
         now = datetime.utcnow()
         # Round to nearest 5 seconds
         rounded = now.replace(second=(now.second // 5) * 5, microsecond=0)
         
-        if self._time_series and self._time_series[-1][0] == rounded:
-            # Increment existing bucket
-            ts, count = self._time_series[-1]
-            self._time_series[-1] = (ts, count + 1)
+        if self._ts_times and self._ts_times[-1] >= rounded:
+            # Increment the latest bucket; if the wall clock stepped back, fold
+            # the event into it rather than break the sort bisect relies on
+            self._ts_counts[-1] += 1
         else:
-            self._time_series.append((rounded, 1))
+            self._ts_times.append(rounded)
+            self._ts_counts.append(1)
+            if len(self._ts_times) > self._ts_max_points:
+                del self._ts_times[0]
+                del self._ts_counts[0]
     
-    def get_all(self, limit: Optional[int] = None, severity: Optional[str] = None) -> list[StoredEvent]:
+    def get_all(self, limit: Optional[int] = None, severity: Optional[str] = None) -> list[StoredEventRecord]:
         """Get all stored events, optionally filtered."""
-        with self._lock:
-            events = list(self._logs)
-        
+        # Results are in reverse chronological order (newest first)
+        limit = limit or None
         if severity:
-            events = [e for e in events if e.severity == severity]
+            # Served from the per-severity index instead of scanning all logs
+            with self._lock:
+                same_severity = self._logs_by_severity.get(severity)
+                if not same_severity:
+                    return []
+                return list(itertools.islice(reversed(same_severity), limit))
         
-        # Return in reverse chronological order
-        events.reverse()
-        
-        if limit:
-            return events[:limit]
-        return events
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = tuple(reversed(self._logs))
+                snapshot = self._snapshot
+        return list(snapshot[:limit])
     
-    def get_by_id(self, event_id: str) -> Optional[StoredEvent]:
+    def get_by_id(self, event_id: str) -> Optional[StoredEventRecord]:
         """Get a specific event by ID."""
         with self._lock:
-            for event in self._logs:
-                if event.id == event_id:
-                    return event
-        return None
+            return self._by_id.get(event_id)
     
     def count(self) -> int:
         """Get total number of stored events."""
@@ -89,9 +218,13 @@ class LogStorage:
     def get_metrics(self) -> dict:
         """Calculate metrics from stored events."""
         with self._lock:
-            events = list(self._logs)
+            total = len(self._logs)
+            by_severity = dict(self._by_severity)
+            by_type = dict(self._by_type)
+            active_policies = len(self._policies)
+            terminated = self._terminated
         
-        if not events:
+        if not total:
             return {
                 "threats_neutralized": 0,
                 "cluster_health_score": 100.0,
@@ -101,22 +234,6 @@ class LogStorage:
                 "events_by_type": {},
             }
         
-        # Count by severity
-        by_severity: dict[str, int] = {}
-        for e in events:
-            by_severity[e.severity] = by_severity.get(e.severity, 0) + 1
-        
-        # Count by type
-        by_type: dict[str, int] = {}
-        for e in events:
-            by_type[e.event_type] = by_type.get(e.event_type, 0) + 1
-        
-        # Count unique policies
-        policies = set(e.policy_name for e in events)
-        
-        # Count terminated threats
-        terminated = sum(1 for e in events if e.action == "TERMINATED")
-        
         # Calculate health score (higher is better)
         # Base 100, minus penalty for critical/high events
         critical_count = by_severity.get("CRITICAL", 0)
@@ -127,42 +244,49 @@ class LogStorage:
         return {
             "threats_neutralized": terminated,
             "cluster_health_score": round(health_score, 1),
-            "active_policies": len(policies),
-            "total_events": len(events),
+            "active_policies": active_policies,
+            "total_events": total,
             "events_by_severity": by_severity,
             "events_by_type": by_type,
         }
     
     def get_attack_volume(self, minutes: int = 30) -> list[tuple[str, int]]:
         """Get attack volume time series for the last N minutes."""
-        with self._lock:
-            time_series = list(self._time_series)
-        
         cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-        result = []
         
-        for ts, count in time_series:
-            if ts >= cutoff:
-                result.append((ts.isoformat() + "Z", count))
+        with self._lock:
+            start = bisect.bisect_left(self._ts_times, cutoff)
+            times = self._ts_times[start:]
+            counts = self._ts_counts[start:]
         
-        return result
+        return [(ts.isoformat() + "Z", count) for ts, count in zip(times, counts)]
     
     def clear(self) -> int:
         """Clear all stored events. Returns count of cleared events."""
         with self._lock:
             count = len(self._logs)
             self._logs.clear()
-            self._time_series.clear()
+            self._snapshot = None
+            self._ts_times.clear()
+            self._ts_counts.clear()
+            self._by_id.clear()
+            self._logs_by_severity.clear()
+            self._by_severity.clear()
+            self._by_type.clear()
+            self._policies.clear()
+            self._terminated = 0
         return count
 
 
-# Global singleton instance
-_log_storage: Optional[LogStorage] = None
+# Global singleton instance, sized from settings when the module is imported
+_log_storage = LogStorage(get_settings().max_logs)
 
 
-def get_log_storage(max_logs: int = 100) -> LogStorage:
-    """Get the global log storage instance."""
-    global _log_storage
-    if _log_storage is None:
-        _log_storage = LogStorage(max_logs)
+def get_log_storage(max_logs: Optional[int] = None) -> LogStorage:
+    """
+    Get the global log storage instance.
+    
+    `max_logs` is accepted for backward compatibility and ignored; the
+    capacity comes from the MAX_LOGS setting.
+    """
     return _log_storage
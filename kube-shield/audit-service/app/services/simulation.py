@@ -2,20 +2,24 @@
 Security event simulation service for demo purposes.
 Generates realistic fake security logs at regular intervals.
 """
+import bisect
+import itertools
+import logging
+import os
 import random
 import threading
 import time
-from datetime import datetime
 from typing import Callable, Optional
 
-from ..models import SecurityEvent
+from ..core import utc_now_iso
+from ..models import SimulatedEvent
 
 
 class SimulationService:
     """Background service that generates realistic security events."""
     
     # Realistic CVEs and security threats
-    CVES = [
+    CVES = (
         "CVE-2024-3847",
         "CVE-2024-21626",
         "CVE-2024-0193",
@@ -26,19 +30,19 @@ class SimulationService:
         "CVE-2023-29491",
         "CVE-2023-20198",
         "CVE-2023-4911",
-    ]
+    )
     
     # Suspicious IP ranges for egress attempts
-    SUSPICIOUS_IPS = [
+    SUSPICIOUS_IPS = (
         "192.168.100.",
         "10.255.0.",
         "172.16.99.",
         "203.0.113.",
         "198.51.100.",
-    ]
+    )
     
     # Realistic namespace names
-    NAMESPACES = [
+    NAMESPACES = (
         "production",
         "staging",
         "development",
@@ -49,10 +53,10 @@ class SimulationService:
         "frontend",
         "backend-api",
         "ml-workloads",
-    ]
+    )
     
     # Realistic pod name prefixes
-    POD_PREFIXES = [
+    POD_PREFIXES = (
         "api-gateway",
         "user-service",
         "payment-processor",
@@ -63,10 +67,10 @@ class SimulationService:
         "web-frontend",
         "analytics-engine",
         "ml-inference",
-    ]
+    )
     
     # Realistic container images
-    IMAGES = [
+    IMAGES = (
         "gcr.io/production/api:v2.3.1",
         "docker.io/library/nginx:latest",
         "quay.io/prometheus/prometheus:v2.48.0",
@@ -75,42 +79,106 @@ class SimulationService:
         "public.ecr.aws/bitnami/redis:7.2",
         "untrusted-registry.io/malicious:latest",
         "docker.io/library/alpine:3.19",
-    ]
+    )
     
     # Node names
-    NODES = [
+    NODES = (
         "worker-node-01",
-        "worker-node-02", 
+        "worker-node-02",
         "worker-node-03",
         "compute-large-01",
         "compute-large-02",
-    ]
+    )
     
     # Policy names
-    POLICIES = [
+    POLICIES = (
         "default-security-policy",
         "production-strict",
         "payment-pci-policy",
         "network-egress-policy",
         "registry-allowlist",
-    ]
+    )
+    
+    # Severities reported for CVE findings
+    _CVE_SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM")
+    
+    # Actions taken on privileged containers
+    _PRIVILEGED_ACTIONS = ("TERMINATED", "AUDIT")
+    
+    # Ports flagged on unauthorized egress
+    _EGRESS_PORTS = (22, 23, 3389, 4444, 6666, 8080, 9001)
+    
+    # Mining pool endpoints
+    _MINING_POOLS = (
+        "stratum+tcp://xmr.pool.minergate.com:45700",
+        "stratum+tcp://pool.supportxmr.com:3333",
+        "stratum+tcp://xmrpool.eu:5555",
+    )
+    
+    # Internal services probed during lateral movement
+    _LATERAL_TARGETS = (
+        "kubernetes.default.svc",
+        "kube-apiserver:6443",
+        "etcd:2379",
+        "metadata.google.internal",
+    )
+    
+    # Configuration drift kinds
+    _DRIFT_TYPES = (
+        "SecurityContext modified",
+        "Environment variables changed",
+        "Resource limits removed",
+        "Network policy bypassed",
+    )
+    
+    # Registries outside the allowlist
+    _BAD_REGISTRIES = (
+        "untrusted-registry.io",
+        "public.ecr.aws/unknown",
+        "docker.io/malicious-user",
+    )
+    
+    # Privilege escalation techniques
+    _ESCALATIONS = (
+        "setuid binary execution",
+        "CAP_SYS_ADMIN capability usage",
+        "ptrace syscall detected",
+        "Namespace manipulation attempt",
+    )
+    
+    # Alphabet for random pod name suffixes
+    _B36 = "abcdefghijklmnopqrstuvwxyz0123456789"
     
     def __init__(
         self,
-        callback: Callable[[SecurityEvent], None],
-        interval: int = 5,
+        callback: Callable[[list[SimulatedEvent]], None],
+        interval: float = 5.0,
         enabled: bool = True,
+        batch_size: int = 1,
     ):
         self._callback = callback
         self._interval = interval
         self._enabled = enabled
+        self._batch_size = batch_size
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-    
-    def _generate_random_event(self) -> SecurityEvent:
-        """Generate a realistic random security event."""
-        event_generators = [
+        self._log = logging.getLogger(__name__)
+        self._last_error = float("-inf")
+        
+        # Dedicated RNG with its methods bound once, so the generators avoid
+        # a module global plus attribute lookup on every draw. Seeding each
+        # instance from the OS keeps services (and their worker threads)
+        # independent of the shared module-level generator.
+        rng = random.Random(os.urandom(16))
+        self._choice = rng.choice
+        self._choices = rng.choices
+        self._getrandbits = rng.getrandbits
+        self._randint = rng.randint
+        self._random = rng.random
+        self._randrange = rng.randrange
+        
+        self._generators = (
             self._generate_cve_event,
             self._generate_egress_event,
             self._generate_privileged_event,
@@ -119,216 +187,222 @@ class SimulationService:
             self._generate_config_drift_event,
             self._generate_registry_violation_event,
             self._generate_privilege_escalation_event,
-        ]
-        
-        # Weight towards more common events
-        weights = [25, 20, 15, 10, 10, 10, 5, 5]
-        generator = random.choices(event_generators, weights=weights)[0]
-        
-        return generator()
+        )
+        # Weight towards more common events; the cumulative weights are
+        # computed once so each pick is a single bisect
+        self._cum_weights = list(itertools.accumulate([25, 20, 15, 10, 10, 10, 5, 5]))
+        self._total_weight = self._cum_weights[-1]
+    
+    def _generate_random_event(self) -> SimulatedEvent:
+        """Generate a realistic random security event."""
+        i = bisect.bisect(self._cum_weights, self._random() * self._total_weight)
+        return self._generators[i]()
+    
+    def _generate_batch(self, size: int) -> list[SimulatedEvent]:
+        """Generate `size` events, drawing every generator pick in one call."""
+        if size == 1:
+            return [self._generate_random_event()]
+        generators = self._choices(self._generators, cum_weights=self._cum_weights, k=size)
+        return [generate() for generate in generators]
     
     def _random_pod_name(self) -> str:
         """Generate a realistic pod name."""
-        prefix = random.choice(self.POD_PREFIXES)
-        suffix = "".join(random.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=5))
-        return f"{prefix}-{suffix}"
+        prefix = self._choice(self.POD_PREFIXES)
+        # One draw covers all five base-36 suffix characters
+        n = self._randrange(36 ** 5)
+        b36 = self._B36
+        return f"{prefix}-{b36[n % 36]}{b36[n // 36 % 36]}{b36[n // 1296 % 36]}{b36[n // 46656 % 36]}{b36[n // 1679616]}"
     
-    def _generate_cve_event(self) -> SecurityEvent:
+    def _generate_cve_event(self) -> SimulatedEvent:
         """Generate a CVE detection event."""
-        cve = random.choice(self.CVES)
+        cve = self._choice(self.CVES)
         pod = self._random_pod_name()
-        namespace = random.choice(self.NAMESPACES)
-        image = random.choice(self.IMAGES)
+        namespace = self._choice(self.NAMESPACES)
+        image = self._choice(self.IMAGES)
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="CVE_DETECTED",
-            severity=random.choice(["CRITICAL", "HIGH", "MEDIUM"]),
-            podName=pod,
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="CVE_DETECTED",
+            severity=self._CVE_SEVERITIES[int(self._random() * 3)],
+            pod_name=pod,
             namespace=namespace,
             container="main",
             image=image,
             reason=f"{cve} detected in container image",
             action="AUDIT",
-            policyName=random.choice(self.POLICIES),
-            nodeName=random.choice(self.NODES),
+            policy_name=self._choice(self.POLICIES),
+            node_name=self._choice(self.NODES),
             description=f"Container vulnerability scan detected {cve} in image {image}. CVSS score indicates potential remote code execution.",
         )
     
-    def _generate_egress_event(self) -> SecurityEvent:
+    def _generate_egress_event(self) -> SimulatedEvent:
         """Generate an unauthorized egress event."""
-        ip = random.choice(self.SUSPICIOUS_IPS) + str(random.randint(1, 254))
-        port = random.choice([22, 23, 3389, 4444, 6666, 8080, 9001])
+        ip = f"{self._choice(self.SUSPICIOUS_IPS)}{self._randint(1, 254)}"
+        port = self._choice(self._EGRESS_PORTS)
         pod = self._random_pod_name()
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="UNAUTHORIZED_EGRESS",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="UNAUTHORIZED_EGRESS",
             severity="HIGH",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="main",
-            image=random.choice(self.IMAGES),
+            image=self._choice(self.IMAGES),
             reason=f"Unauthorized egress to {ip}:{port}",
             action="AUDIT",
-            policyName="network-egress-policy",
-            nodeName=random.choice(self.NODES),
+            policy_name="network-egress-policy",
+            node_name=self._choice(self.NODES),
             description=f"Pod attempted outbound connection to {ip}:{port} which is not in the allowed egress list. This may indicate data exfiltration or C2 communication.",
         )
     
-    def _generate_privileged_event(self) -> SecurityEvent:
+    def _generate_privileged_event(self) -> SimulatedEvent:
         """Generate a privileged container detection event."""
         pod = self._random_pod_name()
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="PRIVILEGED_CONTAINER",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="PRIVILEGED_CONTAINER",
             severity="CRITICAL",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="privileged-worker",
-            image=random.choice(self.IMAGES),
+            image=self._choice(self.IMAGES),
             reason="Privileged container detected",
-            action=random.choice(["TERMINATED", "AUDIT"]),
-            policyName="default-security-policy",
-            nodeName=random.choice(self.NODES),
-            description=f"Container is running in privileged mode with access to host kernel capabilities. Pod terminated to prevent potential container escape.",
+            action=self._PRIVILEGED_ACTIONS[self._getrandbits(1)],
+            policy_name="default-security-policy",
+            node_name=self._choice(self.NODES),
+            description="Container is running in privileged mode with access to host kernel capabilities. Pod terminated to prevent potential container escape.",
         )
     
-    def _generate_crypto_mining_event(self) -> SecurityEvent:
+    def _generate_crypto_mining_event(self) -> SimulatedEvent:
         """Generate a crypto mining detection event."""
         pod = self._random_pod_name()
-        pool = random.choice([
-            "stratum+tcp://xmr.pool.minergate.com:45700",
-            "stratum+tcp://pool.supportxmr.com:3333",
-            "stratum+tcp://xmrpool.eu:5555",
-        ])
+        pool = self._choice(self._MINING_POOLS)
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="CRYPTO_MINING",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="CRYPTO_MINING",
             severity="CRITICAL",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="main",
             image="alpine:latest",
             reason="Crypto mining activity detected",
             action="TERMINATED",
-            policyName="default-security-policy",
-            nodeName=random.choice(self.NODES),
+            policy_name="default-security-policy",
+            node_name=self._choice(self.NODES),
             description=f"Process attempted to connect to mining pool at {pool}. Container terminated immediately.",
         )
     
-    def _generate_lateral_movement_event(self) -> SecurityEvent:
+    def _generate_lateral_movement_event(self) -> SimulatedEvent:
         """Generate a lateral movement detection event."""
         pod = self._random_pod_name()
-        target_service = random.choice([
-            "kubernetes.default.svc",
-            "kube-apiserver:6443",
-            "etcd:2379",
-            "metadata.google.internal",
-        ])
+        target_service = self._choice(self._LATERAL_TARGETS)
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="LATERAL_MOVEMENT",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="LATERAL_MOVEMENT",
             severity="CRITICAL",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="main",
-            image=random.choice(self.IMAGES),
+            image=self._choice(self.IMAGES),
             reason=f"Suspicious access attempt to {target_service}",
             action="AUDIT",
-            policyName="default-security-policy",
-            nodeName=random.choice(self.NODES),
+            policy_name="default-security-policy",
+            node_name=self._choice(self.NODES),
             description=f"Container made unexpected connection attempt to internal service {target_service}. This may indicate lateral movement or service account token abuse.",
         )
     
-    def _generate_config_drift_event(self) -> SecurityEvent:
+    def _generate_config_drift_event(self) -> SimulatedEvent:
         """Generate a configuration drift event."""
         pod = self._random_pod_name()
-        drift_type = random.choice([
-            "SecurityContext modified",
-            "Environment variables changed",
-            "Resource limits removed",
-            "Network policy bypassed",
-        ])
+        drift_type = self._choice(self._DRIFT_TYPES)
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="CONFIG_DRIFT",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="CONFIG_DRIFT",
             severity="MEDIUM",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="main",
-            image=random.choice(self.IMAGES),
+            image=self._choice(self.IMAGES),
             reason=drift_type,
             action="AUDIT",
-            policyName=random.choice(self.POLICIES),
-            nodeName=random.choice(self.NODES),
+            policy_name=self._choice(self.POLICIES),
+            node_name=self._choice(self.NODES),
             description=f"Configuration drift detected: {drift_type}. Pod configuration does not match declared GitOps state.",
         )
     
-    def _generate_registry_violation_event(self) -> SecurityEvent:
+    def _generate_registry_violation_event(self) -> SimulatedEvent:
         """Generate a disallowed registry event."""
         pod = self._random_pod_name()
-        bad_registry = random.choice([
-            "untrusted-registry.io",
-            "public.ecr.aws/unknown",
-            "docker.io/malicious-user",
-        ])
+        bad_registry = self._choice(self._BAD_REGISTRIES)
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="DISALLOWED_REGISTRY",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="DISALLOWED_REGISTRY",
             severity="HIGH",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="main",
             image=f"{bad_registry}/suspicious-image:latest",
             reason=f"Image from disallowed registry: {bad_registry}",
             action="TERMINATED",
-            policyName="registry-allowlist",
-            nodeName=random.choice(self.NODES),
+            policy_name="registry-allowlist",
+            node_name=self._choice(self.NODES),
             description=f"Pod attempted to use image from {bad_registry} which is not in the approved registry list. Pod terminated.",
         )
     
-    def _generate_privilege_escalation_event(self) -> SecurityEvent:
+    def _generate_privilege_escalation_event(self) -> SimulatedEvent:
         """Generate a privilege escalation event."""
         pod = self._random_pod_name()
-        escalation = random.choice([
-            "setuid binary execution",
-            "CAP_SYS_ADMIN capability usage",
-            "ptrace syscall detected",
-            "Namespace manipulation attempt",
-        ])
+        escalation = self._choice(self._ESCALATIONS)
         
-        return SecurityEvent(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            eventType="PRIVILEGE_ESCALATION",
+        return SimulatedEvent(
+            timestamp=utc_now_iso(),
+            event_type="PRIVILEGE_ESCALATION",
             severity="CRITICAL",
-            podName=pod,
-            namespace=random.choice(self.NAMESPACES),
+            pod_name=pod,
+            namespace=self._choice(self.NAMESPACES),
             container="main",
-            image=random.choice(self.IMAGES),
+            image=self._choice(self.IMAGES),
             reason=f"Privilege escalation: {escalation}",
             action="TERMINATED",
-            policyName="default-security-policy",
-            nodeName=random.choice(self.NODES),
+            policy_name="default-security-policy",
+            node_name=self._choice(self.NODES),
             description=f"Detected {escalation} which may indicate container escape attempt. Immediate action taken.",
         )
     
     def _run(self) -> None:
         """Main simulation loop."""
+        # Ticks follow a fixed monotonic schedule so generation time does not
+        # accumulate as drift; waiting on the event keeps stop() prompt
+        next_tick = time.monotonic()
         while not self._stop_event.is_set():
             try:
-                event = self._generate_random_event()
-                self._callback(event)
-            except Exception as e:
-                # Log but don't crash the simulation
-                print(f"Simulation error: {e}")
+                # One callback per tick for the whole batch. The callback runs
+                # on this thread and must not block; the app's callback only
+                # hands events to LogStorage.enqueue, which is a lock-free
+                # queue drained on the event loop.
+                events = self._generate_batch(self._batch_size)
+                self._callback(events)
+            except Exception:
+                # Log but don't crash the simulation; at most one traceback per
+                # second so a failing callback cannot flood the output
+                now = time.monotonic()
+                if now - self._last_error >= 1.0:
+                    self._last_error = now
+                    self._log.exception("Simulation error")
             
-            self._stop_event.wait(self._interval)
+            next_tick += self._interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Fell behind; resume from now instead of bursting to catch up
+                next_tick -= delay
+                delay = 0
+            self._stop_event.wait(delay)
     
     def start(self) -> None:
         """Start the simulation background thread."""